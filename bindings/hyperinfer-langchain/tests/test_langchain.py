@@ -1,9 +1,11 @@
 """Tests for LangChain integration."""
 
+import asyncio
+import builtins
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from hyperinfer_langchain import HyperInferChatModel
+from hyperinfer_langchain import HyperInferChatModel, _loop
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.outputs import ChatGenerationChunk
 
@@ -35,6 +37,32 @@ class TestRunSyncBridge:
             chunks = list(model._stream([HumanMessage(content="hi")]))
         assert len(chunks) == 1
 
+    def test_new_event_loop_falls_back_without_uvloop(self, monkeypatch):
+        """Test that loop creation degrades to asyncio when uvloop is absent."""
+        real_import = builtins.__import__
+
+        def _no_uvloop(name, *args, **kwargs):
+            if name == "uvloop":
+                raise ImportError("No module named 'uvloop'")
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", _no_uvloop)
+        loop = _loop._new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.AbstractEventLoop)
+        finally:
+            loop.close()
+
+    def test_new_event_loop_prefers_uvloop_when_installed(self):
+        """Test that the uvloop extra backs the created loop."""
+        uvloop = pytest.importorskip("uvloop")
+
+        loop = _loop._new_event_loop()
+        try:
+            assert isinstance(loop, uvloop.Loop)
+        finally:
+            loop.close()
+
 
 class TestHyperInferChatModel:
     """Test suite for HyperInferChatModel."""
@@ -52,6 +80,12 @@ class TestHyperInferChatModel:
         assert model.temperature is None
         assert model.max_tokens is None
 
+    def test_default_client_shared_across_instances(self):
+        """Test that instances without an explicit client share one default."""
+        first = HyperInferChatModel()
+        second = HyperInferChatModel()
+        assert first.client is second.client
+
     def test_custom_attributes(self):
         """Test custom attribute values."""
         model = HyperInferChatModel(
@@ -179,11 +213,97 @@ class TestHyperInferChatModel:
             call_kwargs = mock_chat.call_args.kwargs
             assert call_kwargs["max_tokens"] == 50
 
+    @pytest.mark.asyncio
+    async def test_agenerate_accepts_tuple_of_messages(self):
+        """Test that non-list message sequences are normalized."""
+        model = HyperInferChatModel(model="gpt-4")
+
+        mock_response = {
+            "choices": [{"message": {"role": "assistant", "content": "Hi"}}],
+        }
+
+        with patch.object(model.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.return_value = mock_response
+
+            result = await model._agenerate((HumanMessage(content="Hello"),))
+
+            sent = mock_chat.call_args.kwargs["messages"]
+            assert sent == [{"role": "user", "content": "Hello"}]
+            assert result.generations[0].message.content == "Hi"
+
+    @pytest.mark.asyncio
+    async def test_agenerate_forwards_prefill_chunk_size(self):
+        """Test that the prefill hint reaches the client call."""
+        model = HyperInferChatModel(model="gpt-4", prefill_chunk_size=512)
+
+        mock_response = {
+            "choices": [{"message": {"role": "assistant", "content": "Hi"}}],
+        }
+
+        with patch.object(model.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.return_value = mock_response
+
+            await model._agenerate([HumanMessage(content="Hello")])
+
+            assert mock_chat.call_args.kwargs["prefill_chunk_size"] == 512
+
+    @pytest.mark.asyncio
+    async def test_agenerate_empty_choices(self):
+        """Test that an empty choices list yields empty content."""
+        model = HyperInferChatModel(model="gpt-4")
+
+        with patch.object(model.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.return_value = {"choices": []}
+
+            result = await model._agenerate([HumanMessage(content="Hello")])
+
+            assert result.generations[0].message.content == ""
+
+    @pytest.mark.asyncio
+    async def test_agenerate_trusted_backend_sets_generation_text(self):
+        """Test that the unvalidated fast path still populates derived text."""
+        model = HyperInferChatModel(model="gpt-4")
+        assert model.trusted_backend is True
+
+        mock_response = {
+            "choices": [{"message": {"role": "assistant", "content": "Fast"}}],
+        }
+
+        with patch.object(model.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.return_value = mock_response
+
+            result = await model._agenerate([HumanMessage(content="Hello")])
+
+            generation = result.generations[0]
+            assert generation.message.content == "Fast"
+            assert generation.text == "Fast"
+            assert isinstance(generation.message, AIMessage)
+
+    @pytest.mark.asyncio
+    async def test_agenerate_untrusted_backend_validates(self):
+        """Test that trusted_backend=False goes through the validating ctors."""
+        model = HyperInferChatModel(model="gpt-4", trusted_backend=False)
+
+        mock_response = {
+            "choices": [{"message": {"role": "assistant", "content": "Checked"}}],
+        }
+
+        with patch.object(model.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.return_value = mock_response
+
+            result = await model._agenerate([HumanMessage(content="Hello")])
+
+            generation = result.generations[0]
+            assert generation.message.content == "Checked"
+            assert generation.text == "Checked"
+
     @pytest.mark.asyncio
     async def test_from_config(self):
         """Test creating instance from config."""
+        import hyperinfer_langchain
         from hyperinfer import Client, Config
 
+        hyperinfer_langchain._client_cache.clear()
         with patch("hyperinfer_langchain.Client") as MockClient:
             mock_client_instance = MagicMock(spec=Client)
             mock_client_instance.init = AsyncMock()
@@ -201,6 +321,144 @@ class TestHyperInferChatModel:
             MockClient.assert_called_once_with("redis://localhost:6379", config)
             mock_client_instance.init.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_from_config_reuses_cached_client(self):
+        """Test that equivalent configs share one cached client."""
+        import hyperinfer_langchain
+        from hyperinfer import Client, Config
+
+        hyperinfer_langchain._client_cache.clear()
+        with patch("hyperinfer_langchain.Client") as MockClient:
+            mock_client_instance = MagicMock(spec=Client)
+            mock_client_instance.init = AsyncMock()
+            MockClient.return_value = mock_client_instance
+
+            first = await HyperInferChatModel.from_config(config=Config())
+            second = await HyperInferChatModel.from_config(config=Config())
+
+            assert first.client is second.client
+            MockClient.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_from_config_evicts_oldest_client(self):
+        """Test that the client cache stays bounded and evicts oldest-first."""
+        import hyperinfer_langchain
+        from hyperinfer import Client, Config
+
+        maxsize = hyperinfer_langchain._CLIENT_CACHE_MAXSIZE
+        hyperinfer_langchain._client_cache.clear()
+        with patch("hyperinfer_langchain.Client") as MockClient:
+
+            def _make_client(*args, **kwargs):
+                client = MagicMock(spec=Client)
+                client.init = AsyncMock()
+                return client
+
+            MockClient.side_effect = _make_client
+
+            first = await HyperInferChatModel.from_config(
+                config=Config().with_alias("alias-0", "model-0")
+            )
+            for i in range(1, maxsize + 1):
+                await HyperInferChatModel.from_config(
+                    config=Config().with_alias(f"alias-{i}", f"model-{i}")
+                )
+
+            assert len(hyperinfer_langchain._client_cache) == maxsize
+            # The oldest entry was evicted, so an equivalent config now
+            # builds a fresh client rather than reusing the first one.
+            refetched = await HyperInferChatModel.from_config(
+                config=Config().with_alias("alias-0", "model-0")
+            )
+            assert refetched.client is not first.client
+
+
+class TestHyperInferChatModelCache:
+    """Tests for the low-temperature response cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_cache(self):
+        """Test that an identical low-temperature request skips the RPC."""
+        model = HyperInferChatModel(model="gpt-4", temperature=0.0)
+        mock_response = {
+            "choices": [{"message": {"role": "assistant", "content": "Cached"}}],
+        }
+
+        with patch.object(model.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.return_value = mock_response
+
+            first = await model._agenerate([HumanMessage(content="Hello")])
+            second = await model._agenerate([HumanMessage(content="Hello")])
+
+            assert mock_chat.call_count == 1
+            assert second.generations[0].message.content == "Cached"
+            assert first.generations[0].message.content == "Cached"
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_not_cached(self):
+        """Test that high-temperature requests always hit the backend."""
+        model = HyperInferChatModel(model="gpt-4", temperature=0.9)
+        mock_response = {
+            "choices": [{"message": {"role": "assistant", "content": "Sampled"}}],
+        }
+
+        with patch.object(model.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.return_value = mock_response
+
+            await model._agenerate([HumanMessage(content="Hello")])
+            await model._agenerate([HumanMessage(content="Hello")])
+
+            assert mock_chat.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unset_temperature_not_cached(self):
+        """Test that requests without an explicit temperature are not cached."""
+        model = HyperInferChatModel(model="gpt-4")
+        mock_response = {
+            "choices": [{"message": {"role": "assistant", "content": "Default"}}],
+        }
+
+        with patch.object(model.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.return_value = mock_response
+
+            await model._agenerate([HumanMessage(content="Hello")])
+            await model._agenerate([HumanMessage(content="Hello")])
+
+            assert mock_chat.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_result_isolated_from_caller_mutation(self):
+        """Test that mutating a returned result does not corrupt the cache."""
+        model = HyperInferChatModel(model="gpt-4", temperature=0.0)
+        mock_response = {
+            "choices": [{"message": {"role": "assistant", "content": "Original"}}],
+        }
+
+        with patch.object(model.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.return_value = mock_response
+
+            first = await model._agenerate([HumanMessage(content="Hello")])
+            first.generations[0].message.content = "Tampered"
+
+            second = await model._agenerate([HumanMessage(content="Hello")])
+            assert second.generations[0].message.content == "Original"
+
+    @pytest.mark.asyncio
+    async def test_different_messages_miss_cache(self):
+        """Test that different prompts produce distinct cache entries."""
+        model = HyperInferChatModel(model="gpt-4", temperature=0.0)
+        mock_response = {
+            "choices": [{"message": {"role": "assistant", "content": "Reply"}}],
+        }
+
+        with patch.object(model.client, "chat", new_callable=AsyncMock) as mock_chat:
+            mock_chat.return_value = mock_response
+
+            await model._agenerate([HumanMessage(content="Hello")])
+            await model._agenerate([HumanMessage(content="Goodbye")])
+
+            assert mock_chat.call_count == 2
+
 
 class TestHyperInferChatModelStreaming:
     """Tests for _astream and _stream."""
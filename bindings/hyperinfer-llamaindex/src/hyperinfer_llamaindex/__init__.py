@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import concurrent.futures
 import queue
 import threading
+from collections import OrderedDict
 from typing import Any, cast
 
 from hyperinfer import Client, Config
@@ -17,27 +17,72 @@ from llama_index.core.llms import CompletionResponse, CustomLLM, LLMMetadata
 from llama_index.core.llms.callbacks import llm_completion_callback
 from pydantic import Field
 
+from hyperinfer_llamaindex import _loop
 
-def _run_sync(coro: Any) -> Any:
-    """Run *coro* safely from any context — sync or already-async.
+# Run a coroutine safely from any context — sync or already-async.  Bound
+# directly (not wrapped) so sync entry points pay one global lookup per call
+# instead of an extra Python frame; see hyperinfer_llamaindex._loop for why
+# the shared background loop never conflicts with the caller's loop.
+_run_sync = _loop.run_sync
 
-    ``asyncio.run()`` raises ``RuntimeError: This event loop is already
-    running`` when called from inside an async context (FastAPI, Jupyter,
-    LangGraph, etc.).  This helper avoids that by delegating to a
-    *dedicated background thread* that owns its own event loop, then blocks
-    the current thread until the result is ready.
+_default_client: Client | None = None
+_default_client_lock = threading.Lock()
 
-    Because we use a fresh thread, there is never a loop conflict regardless
-    of what the caller's thread is doing.
+
+def _get_default_client() -> Client:
+    """Return the process-wide default :class:`~hyperinfer.Client`.
+
+    LLMs constructed without an explicit ``client`` all share one
+    lazily-created default rather than each building their own, so every
+    default-configured LLM in the process reuses a single HTTP
+    connection pool and Redis connection.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Client()
+    return _default_client
+
+
+# Bounded: iterating on configs in a long-lived process (the notebook/CLI
+# workflow this cache targets) must not pin every client — and its pools —
+# forever. Oldest entries are evicted first.
+_CLIENT_CACHE_MAXSIZE = 8
+
+_client_cache: OrderedDict[tuple[str, bytes], Client] = OrderedDict()
+_client_cache_lock = threading.Lock()
+
+
+def _get_or_create_client(redis_url: str, config: Config) -> Client:
+    """Return a cached :class:`~hyperinfer.Client` for ``(redis_url, config)``.
+
+    Repeated :meth:`HyperInferLLM.from_config` calls with the same URL and
+    configuration (common in notebook/CLI workflows) reuse one client —
+    and therefore one Redis handshake and HTTP pool — instead of
+    re-connecting each time. The config is fingerprinted via its
+    MessagePack encoding, so equivalent configs hit the same entry. The
+    cache holds at most ``_CLIENT_CACHE_MAXSIZE`` clients; an evicted
+    client is dropped from the cache but stays usable for any LLM still
+    holding it, and releases its connections once unreferenced.
     """
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        return pool.submit(asyncio.run, coro).result()
+    cache_key = (redis_url, config.to_bytes())
+    with _client_cache_lock:
+        client = _client_cache.get(cache_key)
+        if client is None:
+            client = Client(redis_url, config)
+            _client_cache[cache_key] = client
+            if len(_client_cache) > _CLIENT_CACHE_MAXSIZE:
+                _client_cache.popitem(last=False)
+        else:
+            _client_cache.move_to_end(cache_key)
+    return client
 
 
 class HyperInferLLM(CustomLLM):
     """LlamaIndex LLM backed by HyperInfer."""
 
-    client: Client = Field(default_factory=Client)
+    client: Client = Field(default_factory=_get_default_client)
     model: str = Field(default="gpt-4")
     virtual_key: str = Field(default="default")
     temperature: float | None = Field(default=None)
@@ -70,15 +115,47 @@ class HyperInferLLM(CustomLLM):
                 max_tokens=self.max_tokens,
             )
 
-            choices = response.get("choices", [])
-            if not choices:
+            # Direct indexing on the expected shape; malformed or empty
+            # responses degrade to empty content.
+            try:
+                content = response["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
                 content = ""
-            else:
-                content = choices[0].get("message", {}).get("content", "")
             return CompletionResponse(text=content, raw=response)
         except Exception as e:
             raise RuntimeError(f"LLM completion failed: {e}") from e
 
+    async def abatch_complete(
+        self, prompts: list[str], concurrency: int = 32
+    ) -> list[CompletionResponse]:
+        """Complete many prompts concurrently via :meth:`Client.chat_batch`.
+
+        All requests are fanned out at once (bounded by ``concurrency``)
+        instead of being awaited sequentially, keeping the gateway's
+        continuous-batching pipeline full. Responses come back in prompt
+        order.
+        """
+        try:
+            responses = await self.client.chat_batch(
+                key=self.virtual_key,
+                model=self.model,
+                messages_list=[[{"role": "user", "content": prompt}] for prompt in prompts],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                concurrency=concurrency,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Batch completion failed: {e}") from e
+
+        results: list[CompletionResponse] = []
+        for response in responses:
+            try:
+                content = response["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                content = ""
+            results.append(CompletionResponse(text=content, raw=response))
+        return results
+
     @llm_completion_callback()
     def stream_complete(
         self, prompt: str, formatted: bool = False, **kwargs: Any
@@ -194,12 +271,14 @@ class HyperInferLLM(CustomLLM):
     ) -> HyperInferLLM:
         """Create an instance with configuration.
 
-        The underlying :class:`~hyperinfer.Client` is constructed eagerly here.
-        Call :meth:`~hyperinfer.Client.init` (or use an ``async with`` block)
+        The underlying :class:`~hyperinfer.Client` is constructed eagerly here
+        and cached by ``(redis_url, config)``, so repeated calls with an
+        equivalent configuration share one connection. Call
+        :meth:`~hyperinfer.Client.init` (or use an ``async with`` block)
         before invoking :meth:`complete` or :meth:`_acomplete` if you need the
         connection to be established before the first request.
         """
-        client = Client(redis_url=redis_url, config=config)
+        client = _get_or_create_client(redis_url, config)
         return cls(client=client, model=model, virtual_key=virtual_key, **kwargs)
 
 
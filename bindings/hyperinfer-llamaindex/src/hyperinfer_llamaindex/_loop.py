@@ -0,0 +1,71 @@
+"""Process-wide background event loop for bridging sync callers into async code.
+
+``asyncio.run()`` creates and tears down a whole event loop — selector,
+self-pipe, signal handlers — on every call, which dominates the cost of
+short completions when sync entry points like :meth:`HyperInferLLM.complete`
+are invoked in a tight loop.  This module amortizes that setup to once per
+process: a single loop runs forever in a daemon thread and coroutines are
+dispatched to it with :func:`asyncio.run_coroutine_threadsafe`.
+
+Because the loop lives in its own dedicated thread, dispatching is safe
+from any calling context — plain-sync code and threads that already run
+an event loop (FastAPI, Jupyter, LangGraph) alike.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Build the background loop, preferring uvloop when installed.
+
+    uvloop's libuv-based loop cuts per-syscall overhead for workloads
+    dominated by concurrent HTTP calls.  It is an optional extra: the
+    import happens here rather than at module import so merely loading
+    this package never pays for (or requires) it, and the loop is created
+    directly instead of via a global ``set_event_loop_policy`` so the
+    host application's own loops are left untouched.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+    return loop
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background loop, starting it on first use."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = _new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="hyperinfer-llamaindex-loop",
+                    daemon=True,
+                )
+                thread.start()
+                _loop = loop
+    return _loop
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> Future[T]:
+    """Schedule *coro* on the shared loop and return a concurrent Future."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run *coro* to completion on the shared loop, blocking the caller."""
+    return submit(coro).result()
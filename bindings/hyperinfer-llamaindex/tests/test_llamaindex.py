@@ -1,9 +1,11 @@
 """Tests for LlamaIndex integration."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import builtins
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from hyperinfer_llamaindex import HyperInferLLM
+from hyperinfer_llamaindex import HyperInferLLM, _loop
 from llama_index.core.llms import CompletionResponse
 
 
@@ -50,6 +52,32 @@ class TestRunSyncBridge:
         assert len(chunks) == 2
         assert chunks[-1].text == "hello!"
 
+    def test_new_event_loop_falls_back_without_uvloop(self, monkeypatch):
+        """Test that loop creation degrades to asyncio when uvloop is absent."""
+        real_import = builtins.__import__
+
+        def _no_uvloop(name, *args, **kwargs):
+            if name == "uvloop":
+                raise ImportError("No module named 'uvloop'")
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", _no_uvloop)
+        loop = _loop._new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.AbstractEventLoop)
+        finally:
+            loop.close()
+
+    def test_new_event_loop_prefers_uvloop_when_installed(self):
+        """Test that the uvloop extra backs the created loop."""
+        uvloop = pytest.importorskip("uvloop")
+
+        loop = _loop._new_event_loop()
+        try:
+            assert isinstance(loop, uvloop.Loop)
+        finally:
+            loop.close()
+
 
 class TestHyperInferLLM:
     """Test suite for HyperInferLLM."""
@@ -72,6 +100,12 @@ class TestHyperInferLLM:
         assert llm.context_window == 4096
         assert llm.num_output == 256
 
+    def test_default_client_shared_across_instances(self):
+        """Test that instances without an explicit client share one default."""
+        first = HyperInferLLM()
+        second = HyperInferLLM()
+        assert first.client is second.client
+
     def test_custom_attributes(self):
         """Test custom attribute values."""
         llm = HyperInferLLM(
@@ -148,6 +182,28 @@ class TestHyperInferLLM:
             call_kwargs = mock_chat.call_args.kwargs
             assert call_kwargs["max_tokens"] == 50
 
+    @pytest.mark.asyncio
+    async def test_abatch_complete_preserves_prompt_order(self):
+        """Test batch completion fans out once and keeps prompt order."""
+        llm = HyperInferLLM(model="gpt-4", virtual_key="test-key")
+
+        def fake_batch(**kwargs):
+            return [
+                {"choices": [{"message": {"content": messages[0]["content"].upper()}}]}
+                for messages in kwargs["messages_list"]
+            ]
+
+        with patch.object(llm.client, "chat_batch", new_callable=AsyncMock) as mock_batch:
+            mock_batch.side_effect = fake_batch
+
+            results = await llm.abatch_complete(["alpha", "beta", "gamma"])
+
+            assert [r.text for r in results] == ["ALPHA", "BETA", "GAMMA"]
+            mock_batch.assert_called_once()
+            call_kwargs = mock_batch.call_args.kwargs
+            assert call_kwargs["key"] == "test-key"
+            assert call_kwargs["model"] == "gpt-4"
+
     @pytest.mark.asyncio
     async def test_acomplete_error_handling(self):
         """Test error handling in async completion."""
@@ -179,9 +235,11 @@ class TestHyperInferLLM:
 
     def test_from_config(self):
         """Test creating instance from config."""
+        import hyperinfer_llamaindex
         from hyperinfer import Client, Config
 
         config = Config()
+        hyperinfer_llamaindex._client_cache.clear()
         with patch("hyperinfer_llamaindex.Client", spec=Client) as MockClient:
             llm = HyperInferLLM.from_config(
                 config=config,
@@ -191,20 +249,55 @@ class TestHyperInferLLM:
 
             assert llm.model == "claude-3"
             assert llm.virtual_key == "my-key"
-            MockClient.assert_called_once_with(redis_url="redis://localhost:6379", config=config)
+            MockClient.assert_called_once_with("redis://localhost:6379", config)
 
     def test_from_config_custom_redis_url(self):
         """Test creating instance from config with custom redis URL."""
+        import hyperinfer_llamaindex
         from hyperinfer import Client, Config
 
         config = Config()
+        hyperinfer_llamaindex._client_cache.clear()
         with patch("hyperinfer_llamaindex.Client", spec=Client) as MockClient:
             HyperInferLLM.from_config(
                 config=config,
                 redis_url="redis://custom:6379",
             )
 
-            MockClient.assert_called_once_with(redis_url="redis://custom:6379", config=config)
+            MockClient.assert_called_once_with("redis://custom:6379", config)
+
+    def test_from_config_reuses_cached_client(self):
+        """Test that equivalent configs share one cached client."""
+        import hyperinfer_llamaindex
+        from hyperinfer import Client, Config
+
+        hyperinfer_llamaindex._client_cache.clear()
+        with patch("hyperinfer_llamaindex.Client", spec=Client) as MockClient:
+            first = HyperInferLLM.from_config(config=Config())
+            second = HyperInferLLM.from_config(config=Config())
+
+            assert first.client is second.client
+            MockClient.assert_called_once()
+
+    def test_from_config_evicts_oldest_client(self):
+        """Test that the client cache stays bounded and evicts oldest-first."""
+        import hyperinfer_llamaindex
+        from hyperinfer import Client, Config
+
+        maxsize = hyperinfer_llamaindex._CLIENT_CACHE_MAXSIZE
+        hyperinfer_llamaindex._client_cache.clear()
+        with patch("hyperinfer_llamaindex.Client") as MockClient:
+            MockClient.side_effect = lambda *args, **kwargs: MagicMock(spec=Client)
+
+            first = HyperInferLLM.from_config(config=Config().with_alias("alias-0", "model-0"))
+            for i in range(1, maxsize + 1):
+                HyperInferLLM.from_config(config=Config().with_alias(f"alias-{i}", f"model-{i}"))
+
+            assert len(hyperinfer_llamaindex._client_cache) == maxsize
+            # The oldest entry was evicted, so an equivalent config now
+            # builds a fresh client rather than reusing the first one.
+            refetched = HyperInferLLM.from_config(config=Config().with_alias("alias-0", "model-0"))
+            assert refetched.client is not first.client
 
     @pytest.mark.asyncio
     async def test_acomplete_empty_response(self):
@@ -171,6 +171,7 @@ mod tests {
             temperature: None,
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         }
     }
 
@@ -29,6 +29,29 @@ pub struct HttpCaller {
     client: Client,
 }
 
+/// HTTP connection-pool tuning forwarded from the SDK surface.
+///
+/// A small idle pool (the default of 16) keeps enough warm connections per
+/// provider host to serve concurrent fan-out without the TLS-handshake cost
+/// of reconnecting, while avoiding the diminishing returns of much larger
+/// pools.
+#[derive(Debug, Clone, Copy)]
+pub struct PoolOptions {
+    /// Maximum idle connections kept alive per upstream host.
+    pub max_idle_per_host: usize,
+    /// Total per-request timeout.
+    pub timeout: std::time::Duration,
+}
+
+impl Default for PoolOptions {
+    fn default() -> Self {
+        Self {
+            max_idle_per_host: 16,
+            timeout: std::time::Duration::from_secs(60),
+        }
+    }
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct OpenAiResponse {
     pub id: String,
@@ -58,8 +81,13 @@ pub struct UsageDetail {
 
 impl HttpCaller {
     pub fn new() -> Result<Self, reqwest::Error> {
+        Self::new_with_options(PoolOptions::default())
+    }
+
+    pub fn new_with_options(options: PoolOptions) -> Result<Self, reqwest::Error> {
         let client = Client::builder()
-            .timeout(std::time::Duration::from_secs(60))
+            .timeout(options.timeout)
+            .pool_max_idle_per_host(options.max_idle_per_host)
             .build()?;
         Ok(Self { client })
     }
@@ -750,6 +778,7 @@ mod tests {
             max_tokens: Some(100),
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         };
 
         // We can't actually call OpenAI without a real API key and network,
@@ -784,6 +813,7 @@ mod tests {
             max_tokens: Some(200),
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         };
 
         // Extract system message
@@ -9,7 +9,7 @@ pub mod telemetry_otlp;
 mod util;
 
 pub use cache::ExactMatchCache;
-pub use http_client::HttpCaller;
+pub use http_client::{HttpCaller, PoolOptions};
 pub use mirroring::{MirrorConfig, MirrorHandle};
 pub use router::Router;
 pub use telemetry::Telemetry;
@@ -147,7 +147,16 @@ pub struct HyperInferClient {
 
 impl HyperInferClient {
     pub async fn new(redis_url: &str, config: Config) -> Result<Self, HyperInferError> {
-        let http_caller = Arc::new(HttpCaller::new().map_err(HyperInferError::Http)?);
+        Self::new_with_pool(redis_url, config, PoolOptions::default()).await
+    }
+
+    pub async fn new_with_pool(
+        redis_url: &str,
+        config: Config,
+        pool: PoolOptions,
+    ) -> Result<Self, HyperInferError> {
+        let http_caller =
+            Arc::new(HttpCaller::new_with_options(pool).map_err(HyperInferError::Http)?);
         let router = Arc::new(
             Router::new(config.routing_rules.clone())
                 .with_aliases(config.model_aliases.clone())
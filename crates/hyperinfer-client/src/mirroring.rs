@@ -216,6 +216,7 @@ mod tests {
             temperature: None,
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         };
 
         maybe_mirror(handle, http, router, config, "key".to_string(), request);
@@ -241,6 +242,7 @@ mod tests {
             temperature: None,
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         };
 
         maybe_mirror(handle, http, router, config, "key".to_string(), request);
@@ -268,6 +270,7 @@ mod tests {
             temperature: None,
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         };
 
         maybe_mirror(handle, http, router, config, "key".to_string(), request);
@@ -312,6 +315,7 @@ mod tests {
             temperature: None,
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         };
 
         maybe_mirror(handle, http, router, config, "key".to_string(), request);
@@ -21,6 +21,13 @@ pub struct ChatRequest {
     /// Stop sequences: generation halts when any of these strings is produced.
     #[serde(skip_serializing_if = "Option::is_none")]
     pub stop: Option<Vec<String>>,
+    /// Chunked-prefill hint for serving engines that support it (e.g.
+    /// vLLM-style backends): the prefill token chunk size to schedule.
+    /// The built-in OpenAI and Anthropic providers do not forward it
+    /// upstream (their APIs reject or lack the parameter); injected
+    /// registry providers can read it off the request.
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub prefill_chunk_size: Option<u32>,
 }
 
 /// A single streamed token delta from a provider SSE event.
@@ -194,6 +201,7 @@ mod tests {
             max_tokens: None,
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         };
 
         assert!(request.validate().is_err());
@@ -208,6 +216,7 @@ mod tests {
             max_tokens: None,
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         };
 
         assert!(request.validate().is_err());
@@ -225,6 +234,7 @@ mod tests {
             max_tokens: Some(100),
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         };
 
         assert!(request.validate().is_ok());
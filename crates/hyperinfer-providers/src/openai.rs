@@ -46,6 +46,10 @@ fn chat_request_to_openai_body(request: &ChatRequest) -> serde_json::Value {
     if let Some(stop) = &request.stop {
         body.insert("stop".to_string(), serde_json::json!(stop));
     }
+    // `prefill_chunk_size` is deliberately NOT forwarded: this provider
+    // always targets api.openai.com, which rejects unknown body parameters
+    // with HTTP 400. Injected registry providers for vLLM-style backends
+    // can read the hint off `ChatRequest` themselves.
     serde_json::Value::Object(body)
 }
 
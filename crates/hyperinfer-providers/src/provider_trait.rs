@@ -43,6 +43,7 @@ pub trait LlmProvider: dyn_clone::DynClone + Send + Sync {
             max_tokens: Some(1),
             stream: None,
             stop: None,
+            prefill_chunk_size: None,
         };
         self.chat(&request, api_key).await?;
         Ok(())
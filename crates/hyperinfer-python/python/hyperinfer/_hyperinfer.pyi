@@ -49,12 +49,17 @@ class HyperInferClient:
         config: Optional configuration dictionary as produced by
             :meth:`hyperinfer.Config.to_dict`.  When omitted an empty
             configuration is used.
+        pool_max_idle: Maximum idle HTTP connections kept warm per provider
+            host.
+        timeout_ms: Total per-request timeout in milliseconds.
     """
 
     def __init__(
         self,
         redis_url: str,
         config: dict[str, Any] | None = None,
+        pool_max_idle: int = 16,
+        timeout_ms: int = 60_000,
     ) -> None: ...
     async def init(self) -> None:
         """Initialise the underlying Rust client.
@@ -64,6 +69,21 @@ class HyperInferClient:
         """
         ...
 
+    async def init_from_bytes(self, config: bytes) -> None:
+        """Initialise from a MessagePack-encoded configuration payload.
+
+        Same semantics as :meth:`init`, but the configuration (same shape
+        as :meth:`hyperinfer.Config.to_dict`, encoded by
+        :meth:`hyperinfer.Config.to_bytes`) is decoded on the Rust side
+        with a single ``rmp_serde::from_slice`` call instead of walking a
+        Python dict.
+
+        Raises:
+            ValueError: If the payload is not a valid configuration.
+            RuntimeError: If the client is already initialised.
+        """
+        ...
+
     async def chat(
         self,
         key: str,
@@ -110,6 +130,26 @@ class HyperInferClient:
         """
         ...
 
+    async def chat_raw(
+        self,
+        key: str,
+        request: bytes,
+    ) -> dict[str, Any]:
+        """Send a pre-encoded JSON chat request through the data plane.
+
+        Same semantics as :meth:`chat`, but accepts the request body as
+        JSON ``bytes`` (same shape as the :meth:`chat` dict) so the Rust
+        side deserializes it in one ``serde_json::from_slice`` call instead
+        of walking a Python dict.
+
+        Raises:
+            ValueError: If the payload is not a valid chat request.
+            RuntimeError: If the client has not been initialised via
+                :meth:`init`, if the rate limit is exceeded, or if the
+                upstream provider returns an error.
+        """
+        ...
+
     async def chat_stream(
         self,
         key: str,
@@ -1,9 +1,12 @@
 """High-level async client for HyperInfer."""
 
 import asyncio
+import types
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
+import msgspec
+
 from hyperinfer.config import Config
 
 # This block is seen by IDEs/Linters but ignored at runtime
@@ -20,6 +23,27 @@ def __getattr__(name: str) -> type["HyperInferClient"]:
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+class _ChatRequest(msgspec.Struct, omit_defaults=True):
+    """Chat request payload, pre-encoded to JSON bytes for the FFI boundary.
+
+    Encoding the request once with msgspec and handing the native extension
+    a single ``bytes`` object avoids a Python dict materialization per call
+    and the Rust-side per-field dict walk; the Rust side deserializes the
+    payload with one ``serde_json::from_slice``. ``omit_defaults`` keeps
+    ``None`` fields off the wire, matching the dict-based request shape.
+    """
+
+    model: str
+    messages: list[dict[str, str]]
+    temperature: float | None = None
+    max_tokens: int | None = None
+    stop: list[str] | None = None
+    prefill_chunk_size: int | None = None
+
+
+_encode_chat_request = msgspec.json.Encoder().encode
+
+
 class Client:
     """Async client wrapper for HyperInfer.
 
@@ -30,11 +54,28 @@ class Client:
         self,
         redis_url: str = "redis://localhost:6379",
         config: Config | None = None,
+        *,
+        pool_max_idle: int = 16,
+        timeout_ms: int = 60_000,
     ):
-        """Initialize the client."""
+        """Initialize the client.
+
+        Args:
+            redis_url: Redis connection URL for rate limiting and telemetry.
+            config: Optional configuration built with :class:`Config`.
+            pool_max_idle: Maximum idle HTTP connections kept warm per
+                provider host. A small pool (the default of 16) serves
+                concurrent fan-out without reconnect/TLS cost; much larger
+                values show diminishing or negative returns.
+            timeout_ms: Total per-request timeout in milliseconds.
+        """
         self._config_dict = config.to_dict() if config is not None else None
+        self._config_bytes = config.to_bytes() if config is not None else None
+        self._pool_max_idle = pool_max_idle
+        self._timeout_ms = timeout_ms
         self._redis_url = redis_url
         self._inner: Any = None
+        self._chat_raw: Any = None
         self._initialized = False
         self._lifecycle_lock = asyncio.Lock()
         self._init_lock = asyncio.Lock()
@@ -47,9 +88,31 @@ class Client:
             if self._inner is None:
                 from hyperinfer._hyperinfer import HyperInferClient
 
-                self._inner = HyperInferClient(self._redis_url, self._config_dict)
-            await self._inner.init()
+                try:
+                    self._inner = HyperInferClient(
+                        self._redis_url,
+                        self._config_dict,
+                        pool_max_idle=self._pool_max_idle,
+                        timeout_ms=self._timeout_ms,
+                    )
+                except TypeError:
+                    # Native extensions predating the pool knobs.
+                    self._inner = HyperInferClient(self._redis_url, self._config_dict)
+            # Prefer the MessagePack config path: one bytes object crosses
+            # the boundary and Rust decodes it in a single from_slice call.
+            # Older native builds fall back to the dict-walking init().
+            init_from_bytes = getattr(self._inner, "init_from_bytes", None)
+            if self._config_bytes is not None and init_from_bytes is not None:
+                await init_from_bytes(self._config_bytes)
+            else:
+                await self._inner.init()
+            # Resolved once: native extensions predating chat_raw fall back
+            # to the dict-based chat path.
+            self._chat_raw = getattr(self._inner, "chat_raw", None)
             self._initialized = True
+            # One-shot method swap: steady-state chat() calls skip the
+            # lifecycle lock and init branch entirely. close() undoes this.
+            self.chat = types.MethodType(Client._chat_fast, self)  # type: ignore[method-assign]
 
     async def chat(
         self,
@@ -59,6 +122,7 @@ class Client:
         temperature: float | None = None,
         max_tokens: int | None = None,
         stop: list[str] | None = None,
+        prefill_chunk_size: int | None = None,
     ) -> dict[str, Any]:
         """Send a chat request to the LLM gateway.
 
@@ -69,6 +133,11 @@ class Client:
             temperature: Sampling temperature (0.0-2.0).
             max_tokens: Maximum tokens to generate.
             stop: Stop sequences; generation halts when any is produced.
+            prefill_chunk_size: Chunked-prefill hint carried on the request
+                for injected registry providers that target vLLM-style
+                backends. The built-in OpenAI and Anthropic providers do
+                not forward it upstream (their APIs reject or lack the
+                parameter).
 
         Returns:
             Response dictionary containing model output and usage info.
@@ -76,8 +145,48 @@ class Client:
         async with self._lifecycle_lock:
             if not self._initialized:
                 await self.init()
-            inner = self._inner
 
+        return await self._chat_fast(
+            key,
+            model,
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stop=stop,
+            prefill_chunk_size=prefill_chunk_size,
+        )
+
+    async def _chat_fast(
+        self,
+        key: str,
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+        prefill_chunk_size: int | None = None,
+    ) -> dict[str, Any]:
+        """Send a chat request without the init guard.
+
+        ``init()`` rebinds ``self.chat`` to this method once initialization
+        has completed, so the steady-state path pays neither the lifecycle
+        lock nor the initialized branch. Same signature and semantics as
+        :meth:`chat`.
+        """
+        if self._chat_raw is not None:
+            payload = _encode_chat_request(
+                _ChatRequest(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stop=stop,
+                    prefill_chunk_size=prefill_chunk_size,
+                )
+            )
+            return await self._chat_raw(key, payload)  # type: ignore[no-any-return]
+
+        # Compatibility shim for native extensions without chat_raw.
         request: dict[str, Any] = {
             "model": model,
             "messages": messages,
@@ -88,8 +197,55 @@ class Client:
             request["max_tokens"] = max_tokens
         if stop is not None:
             request["stop"] = stop
+        if prefill_chunk_size is not None:
+            request["prefill_chunk_size"] = prefill_chunk_size
+
+        return await self._inner.chat(key, request)  # type: ignore[no-any-return]
+
+    async def chat_batch(
+        self,
+        key: str,
+        model: str,
+        messages_list: list[list[dict[str, str]]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+        concurrency: int = 32,
+    ) -> list[dict[str, Any]]:
+        """Send many chat requests concurrently and collect all responses.
+
+        Fans the requests out with ``asyncio.gather`` so the gateway's
+        continuous-batching pipeline stays full instead of receiving one
+        request at a time. A semaphore caps in-flight requests so very large
+        batches do not overwhelm the connection pool.
+
+        Args:
+            key: API key for authentication (shared by all requests).
+            model: Model identifier (e.g., "gpt-4", "claude-3").
+            messages_list: One conversation (list of role/content dicts) per
+                request; responses are returned in the same order.
+            temperature: Sampling temperature (0.0-2.0).
+            max_tokens: Maximum tokens to generate.
+            stop: Stop sequences; generation halts when any is produced.
+            concurrency: Maximum number of in-flight requests.
+
+        Returns:
+            List of response dictionaries, one per entry in ``messages_list``.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(messages: list[dict[str, str]]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.chat(
+                    key=key,
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stop=stop,
+                )
 
-        return await inner.chat(key, request)  # type: ignore[no-any-return]
+        return list(await asyncio.gather(*(_one(messages) for messages in messages_list)))
 
     async def stream(
         self,
@@ -164,7 +320,11 @@ class Client:
             if hasattr(self._inner, "close"):
                 await self._inner.close()
             self._inner = None
+            self._chat_raw = None
             self._initialized = False
+            # Undo the init-time method swap so the guarded class method is
+            # visible again and a later call re-initializes.
+            self.__dict__.pop("chat", None)
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
@@ -2,6 +2,13 @@
 
 from typing import Any
 
+import msgspec
+
+# Providers the native gateway recognizes as a default_provider; mirrors
+# the validation the dict-based init path performs on the Rust side
+# (config_from_py). Kept in sync with hyperinfer_core::Provider.
+_KNOWN_PROVIDERS = frozenset({"openai", "anthropic"})
+
 
 class Config:
     """Configuration builder for HyperInfer client.
@@ -16,6 +23,8 @@ class Config:
         self._quotas: dict[str, dict[str, int | None]] = {}
         self._model_aliases: dict[str, str] = {}
         self._default_provider: str | None = None
+        # Cached to_dict() snapshot; None means dirty (rebuild on next call).
+        self._cached_dict: dict[str, Any] | None = None
 
     def with_api_key(self, provider: str, key: str) -> "Config":
         """Add an API key for a provider.
@@ -28,6 +37,7 @@ class Config:
             Self for method chaining.
         """
         self._api_keys[provider] = key
+        self._cached_dict = None
         return self
 
     def with_alias(self, alias: str, target: str) -> "Config":
@@ -41,6 +51,7 @@ class Config:
             Self for method chaining.
         """
         self._model_aliases[alias] = target
+        self._cached_dict = None
         return self
 
     def with_routing_rule(self, name: str, priority: int, fallbacks: list[str]) -> "Config":
@@ -61,6 +72,7 @@ class Config:
                 "fallback_models": fallbacks,
             }
         )
+        self._cached_dict = None
         return self
 
     def with_quota(
@@ -94,6 +106,7 @@ class Config:
             ),
             "budget_cents": budget_cents,
         }
+        self._cached_dict = None
         return self
 
     def with_default_provider(self, provider: str) -> "Config":
@@ -106,18 +119,81 @@ class Config:
             Self for method chaining.
         """
         self._default_provider = provider
+        self._cached_dict = None
         return self
 
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the pristine internal snapshot, rebuilding it if dirty.
+
+        The snapshot is rebuilt only after a ``with_*`` mutation and is
+        never handed to callers directly — :meth:`to_dict` copies it and
+        :meth:`to_bytes` only reads it — so no caller mutation can taint
+        it.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "api_keys": dict(self._api_keys),
+                "routing_rules": [
+                    {**rule, "fallback_models": list(rule["fallback_models"])}
+                    for rule in self._routing_rules
+                ],
+                "quotas": {key: dict(quota) for key, quota in self._quotas.items()},
+                "model_aliases": dict(self._model_aliases),
+                "default_provider": self._default_provider,
+            }
+        return self._cached_dict
+
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary.
 
+        Built from a cached snapshot rebuilt only after a ``with_*``
+        mutation, so repeated calls on an unchanged config skip the walk
+        over the internal containers. Each call returns a fresh copy,
+        nested lists included: mutating a returned dict alters neither
+        this configuration nor any other returned dict, and further
+        ``with_*`` calls do not alter previously returned dicts.
+
         Returns:
             Dictionary representation of the configuration.
         """
+        snapshot = self._snapshot()
         return {
-            "api_keys": self._api_keys,
-            "routing_rules": self._routing_rules,
-            "quotas": self._quotas,
-            "model_aliases": self._model_aliases,
-            "default_provider": self._default_provider,
+            "api_keys": dict(snapshot["api_keys"]),
+            "routing_rules": [
+                {**rule, "fallback_models": list(rule["fallback_models"])}
+                for rule in snapshot["routing_rules"]
+            ],
+            "quotas": {key: dict(quota) for key, quota in snapshot["quotas"].items()},
+            "model_aliases": dict(snapshot["model_aliases"]),
+            "default_provider": snapshot["default_provider"],
         }
+
+    def to_bytes(self) -> bytes:
+        """Encode the configuration to MessagePack bytes for the FFI boundary.
+
+        The payload has the same shape as :meth:`to_dict` and is decoded on
+        the Rust side with a single ``rmp_serde::from_slice`` call
+        (``HyperInferClient.init_from_bytes``), skipping the per-field
+        Python dict walk during client initialization. Encodes straight
+        from the cached snapshot, so no per-call copy is made.
+
+        ``default_provider`` is normalized and validated here before
+        encoding: the bytes path deserializes the provider with a serde
+        catch-all, so an unknown or miscased name would otherwise slip
+        through silently where the dict-based init path raises.
+
+        Returns:
+            MessagePack-encoded configuration.
+
+        Raises:
+            ValueError: If ``default_provider`` is not a known provider.
+        """
+        payload = self._snapshot()
+        provider = payload["default_provider"]
+        if provider is not None:
+            normalized = provider.lower()
+            if normalized not in _KNOWN_PROVIDERS:
+                raise ValueError(f"Unknown provider: '{provider}'")
+            if normalized != provider:
+                payload = {**payload, "default_provider": normalized}
+        return msgspec.msgpack.encode(payload)
@@ -1,5 +1,5 @@
 use futures::StreamExt;
-use hyperinfer_client::HyperInferClient as RustClient;
+use hyperinfer_client::{HyperInferClient as RustClient, PoolOptions};
 use hyperinfer_core::types::Quota;
 use hyperinfer_core::{ChatChunk, ChatResponse, Config, HyperInferError, RoutingRule};
 use pyo3::prelude::*;
@@ -207,12 +207,15 @@ pub struct HyperInferClient {
     /// Python config dict stored until `init()` is awaited.
     /// Wrapped in Arc<RwLock> so we can take() and drop the Py object after init.
     config_dict: Arc<RwLock<Option<Py<PyAny>>>>,
+    /// HTTP connection-pool tuning applied when the client is initialised.
+    pool: PoolOptions,
 }
 
 async fn create_client(
     redis_url: &str,
     inner: &Arc<RwLock<Option<RustClient>>>,
     config_dict: &Arc<RwLock<Option<Py<PyAny>>>>,
+    pool: PoolOptions,
 ) -> Result<RustClient, PyErr> {
     let inner_guard = inner.write().await;
     if inner_guard.is_some() {
@@ -248,7 +251,7 @@ async fn create_client(
         }
     };
 
-    let client = RustClient::new(redis_url, config)
+    let client = RustClient::new_with_pool(redis_url, config, pool)
         .await
         .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
 
@@ -275,13 +278,26 @@ impl HyperInferClient {
     /// `config` is an optional Python dict as returned by
     /// `hyperinfer.Config.to_dict()`.  When omitted an empty configuration
     /// is used (useful for testing without real API keys).
+    ///
+    /// `pool_max_idle` caps idle HTTP connections kept warm per provider
+    /// host and `timeout_ms` is the total per-request timeout; both are
+    /// applied when the client is initialised.
     #[new]
-    #[pyo3(signature = (redis_url, config=None))]
-    pub fn new(redis_url: String, config: Option<Py<PyAny>>) -> Self {
+    #[pyo3(signature = (redis_url, config=None, pool_max_idle=16, timeout_ms=60_000))]
+    pub fn new(
+        redis_url: String,
+        config: Option<Py<PyAny>>,
+        pool_max_idle: usize,
+        timeout_ms: u64,
+    ) -> Self {
         Self {
             inner: Arc::new(RwLock::new(None)),
             redis_url,
             config_dict: Arc::new(RwLock::new(config)),
+            pool: PoolOptions {
+                max_idle_per_host: pool_max_idle,
+                timeout: std::time::Duration::from_millis(timeout_ms),
+            },
         }
     }
 
@@ -292,9 +308,50 @@ impl HyperInferClient {
         let redis_url = self.redis_url.clone();
         let inner = self.inner.clone();
         let config_dict = self.config_dict.clone();
+        let pool = self.pool;
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let client = create_client(&redis_url, &inner, &config_dict, pool).await?;
+            store_and_clear(client, &inner, &config_dict).await;
+            Python::try_attach(|py| Ok(py.None())).ok_or_else(|| {
+                pyo3::exceptions::PyRuntimeError::new_err("Failed to attach to Python")
+            })?
+        })
+    }
+
+    /// Asynchronously initialise from a MessagePack-encoded config payload.
+    ///
+    /// The payload has the same shape as `Config.to_dict()` and is decoded
+    /// with a single `rmp_serde::from_slice` call, skipping the per-field
+    /// Python dict walk of `init()`. Produced by `Config.to_bytes()` on the
+    /// Python side.
+    pub fn init_from_bytes<'a>(
+        &self,
+        py: Python<'a>,
+        config: Vec<u8>,
+    ) -> PyResult<Bound<'a, PyAny>> {
+        let redis_url = self.redis_url.clone();
+        let inner = self.inner.clone();
+        let config_dict = self.config_dict.clone();
+        let pool = self.pool;
 
         pyo3_async_runtimes::tokio::future_into_py(py, async move {
-            let client = create_client(&redis_url, &inner, &config_dict).await?;
+            let parsed: Config = rmp_serde::from_slice(&config).map_err(|e| {
+                pyo3::exceptions::PyValueError::new_err(format!("invalid config payload: {}", e))
+            })?;
+
+            {
+                let inner_guard = inner.write().await;
+                if inner_guard.is_some() {
+                    return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                        "Client already initialized",
+                    ));
+                }
+            }
+
+            let client = RustClient::new_with_pool(&redis_url, parsed, pool)
+                .await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))?;
             store_and_clear(client, &inner, &config_dict).await;
             Python::try_attach(|py| Ok(py.None())).ok_or_else(|| {
                 pyo3::exceptions::PyRuntimeError::new_err("Failed to attach to Python")
@@ -315,9 +372,10 @@ impl HyperInferClient {
         let inner = self.inner.clone();
         let config_dict = self.config_dict.clone();
         let registry = registry_wrapper.get_registry();
+        let pool = self.pool;
 
         pyo3_async_runtimes::tokio::future_into_py(py, async move {
-            let client = create_client(&redis_url, &inner, &config_dict).await?;
+            let client = create_client(&redis_url, &inner, &config_dict, pool).await?;
             client.inject_provider_registry(registry).await;
             store_and_clear(client, &inner, &config_dict).await;
             Python::try_attach(|py| Ok(py.None())).ok_or_else(|| {
@@ -402,6 +460,48 @@ impl HyperInferClient {
         })
     }
 
+    /// Accept a pre-encoded JSON request body (`bytes`) instead of a dict.
+    ///
+    /// The Python side encodes the request once (e.g. with msgspec) and the
+    /// payload is deserialized here with a single `serde_json::from_slice`
+    /// call, skipping the per-field Python dict walk of `chat()`.
+    #[pyo3(name = "chat_raw")]
+    pub fn chat_raw<'a>(
+        &self,
+        py: Python<'a>,
+        key: String,
+        request: Vec<u8>,
+    ) -> PyResult<Bound<'a, PyAny>> {
+        let inner = self.inner.clone();
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            let client = inner.read().await;
+
+            let client = client.as_ref().ok_or_else(|| {
+                pyo3::exceptions::PyRuntimeError::new_err(
+                    "Client not initialized. Call init() first.",
+                )
+            })?;
+
+            let request: hyperinfer_core::ChatRequest =
+                serde_json::from_slice(&request).map_err(|e| {
+                    pyo3::exceptions::PyValueError::new_err(format!("invalid chat request: {}", e))
+                })?;
+
+            let response: ChatResponse =
+                client
+                    .chat(&key, request)
+                    .await
+                    .map_err(|e: HyperInferError| {
+                        pyo3::exceptions::PyRuntimeError::new_err(e.to_string())
+                    })?;
+
+            Python::try_attach(|py| super::types::response_to_py(py, response)).ok_or_else(
+                || pyo3::exceptions::PyRuntimeError::new_err("Failed to attach to Python"),
+            )?
+        })
+    }
+
     /// Return a `ChunkStream` async iterator that yields token-delta dicts.
     ///
     /// Usage:
@@ -64,6 +64,10 @@ pub fn request_from_py(_py: Python<'_>, obj: Py<PyAny>) -> PyResult<ChatRequest>
         .get_item("stop")?
         .map(|v: Bound<'_, PyAny>| v.extract())
         .transpose()?;
+    let prefill_chunk_size: Option<u32> = dict
+        .get_item("prefill_chunk_size")?
+        .map(|v: Bound<'_, PyAny>| v.extract())
+        .transpose()?;
 
     Ok(ChatRequest {
         model,
@@ -72,6 +76,7 @@ pub fn request_from_py(_py: Python<'_>, obj: Py<PyAny>) -> PyResult<ChatRequest>
         max_tokens,
         stream: None,
         stop,
+        prefill_chunk_size,
     })
 }
 
@@ -145,6 +145,73 @@ class TestConfig:
         assert result["quotas"]["default"]["max_requests_per_minute"] == 60
         assert result["default_provider"] == "openai"
 
+    def test_to_dict_cached_until_mutated(self):
+        """Test that to_dict caches its snapshot until the config changes."""
+        config = Config().with_api_key("openai", "sk-test")
+
+        first = config.to_dict()
+        snapshot = config._cached_dict
+        assert config.to_dict() == first
+        assert config._cached_dict is snapshot
+
+        config.with_alias("fast", "gpt-4o-mini")
+        second = config.to_dict()
+
+        assert config._cached_dict is not snapshot
+        assert second["model_aliases"] == {"fast": "gpt-4o-mini"}
+        assert first["model_aliases"] == {}
+
+    def test_to_dict_snapshot_isolated_from_internals(self):
+        """Test that mutating the returned dict does not alter the config."""
+        import msgspec
+
+        config = (
+            Config().with_api_key("openai", "sk-test").with_routing_rule("primary", 10, ["gpt-4"])
+        )
+
+        result = config.to_dict()
+        result["api_keys"]["openai"] = "tampered"
+        result["routing_rules"][0]["fallback_models"].append("gpt-3.5-turbo")
+
+        assert config._api_keys["openai"] == "sk-test"
+        assert config._routing_rules[0]["fallback_models"] == ["gpt-4"]
+
+        fresh = config.to_dict()
+        assert fresh["api_keys"]["openai"] == "sk-test"
+        assert fresh["routing_rules"][0]["fallback_models"] == ["gpt-4"]
+        assert msgspec.msgpack.decode(config.to_bytes()) == fresh
+
+    def test_to_bytes_rejects_unknown_provider(self):
+        """Test that an unknown default provider fails loudly at encode time."""
+        import pytest
+
+        config = Config().with_default_provider("groq")
+
+        with pytest.raises(ValueError, match="Unknown provider: 'groq'"):
+            config.to_bytes()
+
+    def test_to_bytes_normalizes_provider_case(self):
+        """Test that a miscased default provider is lowercased in the payload."""
+        import msgspec
+
+        config = Config().with_default_provider("OpenAI")
+
+        assert msgspec.msgpack.decode(config.to_bytes())["default_provider"] == "openai"
+
+    def test_to_bytes_round_trip(self):
+        """Test that to_bytes encodes the same payload as to_dict."""
+        import msgspec
+
+        config = (
+            Config()
+            .with_api_key("openai", "sk-test")
+            .with_routing_rule("primary", 10, ["gpt-4"])
+            .with_quota("default", rpm=60)
+            .with_default_provider("openai")
+        )
+
+        assert msgspec.msgpack.decode(config.to_bytes()) == config.to_dict()
+
     def test_fluent_api_chain(self):
         """Test fluent API chaining."""
         config = (
@@ -9,11 +9,16 @@ Framework-specific integration tests live in their own packages:
   - bindings/hyperinfer-llamaindex/tests/
 """
 
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from hyperinfer import Client, Config
 
 
-@pytest.fixture
+# Session-scoped: every consumer treats the config as read-only, so one
+# instance serves the whole run instead of being rebuilt per test.
+@pytest.fixture(scope="session")
 def config():
     return (
         Config()
@@ -23,18 +28,22 @@ def config():
     )
 
 
-def test_config_fluent_api():
-    config = (
-        Config()
-        .with_api_key("openai", "sk-test")
-        .with_api_key("anthropic", "sk-ant-test")
-        .with_alias("smart", "gpt-4")
-        .with_quota("team-a", max_requests_per_minute=100)
-    )
+@pytest.mark.parametrize(
+    "providers",
+    [
+        ("openai",),
+        ("openai", "anthropic"),
+        ("openai", "anthropic", "groq"),
+    ],
+)
+def test_config_fluent_api(providers):
+    config = Config().with_alias("smart", "gpt-4").with_quota("team-a", max_requests_per_minute=100)
+    for provider in providers:
+        config.with_api_key(provider, f"sk-{provider}-test")
 
     d = config.to_dict()
-    assert "openai" in d["api_keys"]
-    assert "anthropic" in d["api_keys"]
+    for provider in providers:
+        assert provider in d["api_keys"]
     assert d["model_aliases"]["smart"] == "gpt-4"
 
 
@@ -52,6 +61,69 @@ def test_client_default_no_config():
     assert not client._initialized
 
 
+@pytest.mark.asyncio
+async def test_client_chat_batch_preserves_order():
+    """chat_batch must issue one chat call per conversation, in order."""
+    client = Client()
+
+    with patch.object(client, "chat", new_callable=AsyncMock) as mock_chat:
+        mock_chat.side_effect = lambda **kwargs: {"echo": kwargs["messages"][0]["content"]}
+
+        responses = await client.chat_batch(
+            key="k",
+            model="gpt-4",
+            messages_list=[[{"role": "user", "content": f"prompt-{i}"}] for i in range(5)],
+        )
+
+    assert [r["echo"] for r in responses] == [f"prompt-{i}" for i in range(5)]
+    assert mock_chat.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_chat_prefers_pre_encoded_payload():
+    """chat() must use the chat_raw bytes path when the extension exposes it."""
+    client = Client()
+    fake_inner = MagicMock()
+    fake_inner.init = AsyncMock()
+    fake_inner.chat_raw = AsyncMock(return_value={"id": "r1"})
+    client._inner = fake_inner
+
+    response = await client.chat(
+        key="k",
+        model="gpt-4",
+        messages=[{"role": "user", "content": "hi"}],
+        temperature=0.5,
+    )
+
+    assert response == {"id": "r1"}
+    fake_inner.chat.assert_not_called()
+    key, payload = fake_inner.chat_raw.call_args.args
+    assert key == "k"
+    # None-valued optionals must stay off the wire, matching the dict path.
+    assert json.loads(payload) == {
+        "model": "gpt-4",
+        "messages": [{"role": "user", "content": "hi"}],
+        "temperature": 0.5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_chat_fast_path_installed_after_init():
+    """init() must swap chat to the guard-free fast path; close() undoes it."""
+    client = Client()
+    fake_inner = MagicMock()
+    fake_inner.init = AsyncMock()
+    fake_inner.close = AsyncMock()
+    client._inner = fake_inner
+
+    await client.init()
+    assert client.chat.__func__ is Client._chat_fast
+
+    await client.close()
+    assert "chat" not in client.__dict__
+    assert not client._initialized
+
+
 def test_config_to_dict_completeness(config):
     """to_dict() must contain all expected top-level keys."""
     d = config.to_dict()